@@ -2,7 +2,6 @@
 
 import functools
 import io
-import shutil
 
 from . import CSS
 from .anchors import gather_anchors, make_page_bookmark_tree
@@ -315,6 +314,8 @@ class Document:
         last_by_depth = [root]
         previous_level = 0
         for page_number, page in enumerate(self.pages):
+            if not page.bookmarks:
+                continue
             if transform_pages:
                 matrix = Matrix(a=scale, d=-scale, f=page.height * scale)
             else:
@@ -369,10 +370,8 @@ class Document:
 
         if target is None:
             return output.getvalue()
+        elif hasattr(target, 'write'):
+            target.write(output.getvalue())
         else:
-            output.seek(0)
-            if hasattr(target, 'write'):
-                shutil.copyfileobj(output, target)
-            else:
-                with open(target, 'wb') as fd:
-                    shutil.copyfileobj(output, fd)
+            with open(target, 'wb') as fd:
+                fd.write(output.getbuffer())
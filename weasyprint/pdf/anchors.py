@@ -19,10 +19,11 @@ def add_links(links_and_anchors, matrix, pdf, page, names, mark):
     """Include hyperlinks in given PDF page."""
     links, anchors = links_and_anchors
 
+    annotations = []
     for link_type, link_target, rectangle, box in links:
-        x1, y1 = matrix.transform_point(*rectangle[:2])
-        x2, y2 = matrix.transform_point(*rectangle[2:])
         if link_type in ('internal', 'external'):
+            x1, y1 = matrix.transform_point(*rectangle[:2])
+            x2, y2 = matrix.transform_point(*rectangle[2:])
             box.link_annotation = pydyf.Dictionary({
                 'Type': '/Annot',
                 'Subtype': '/Link',
@@ -40,9 +41,9 @@ def add_links(links_and_anchors, matrix, pdf, page, names, mark):
                     'URI': pydyf.String(link_target),
                 })
             pdf.add_object(box.link_annotation)
-            if 'Annots' not in page:
-                page['Annots'] = pydyf.Array()
-            page['Annots'].append(box.link_annotation.reference)
+            annotations.append(box.link_annotation.reference)
+    if annotations:
+        page.setdefault('Annots', pydyf.Array()).extend(annotations)
 
     for anchor in anchors:
         anchor_name, x, y = anchor
@@ -260,16 +261,14 @@ def write_pdf_attachment(pdf, attachment, url_fetcher):
             if isinstance(source, bytes):
                 source = io.BytesIO(source)
             uncompressed_length = 0
-            stream = b''
+            stream = []
             md5 = hashlib.md5()
             compress = zlib.compressobj()
             for data in iter(lambda: source.read(4096), b''):
                 uncompressed_length += len(data)
                 md5.update(data)
-                compressed = compress.compress(data)
-                stream += compressed
-            compressed = compress.flush(zlib.Z_FINISH)
-            stream += compressed
+                stream.append(compress.compress(data))
+            stream.append(compress.flush(zlib.Z_FINISH))
             file_extra = pydyf.Dictionary({
                 'Type': '/EmbeddedFile',
                 'Filter': '/FlateDecode',
@@ -278,7 +277,7 @@ def write_pdf_attachment(pdf, attachment, url_fetcher):
                     'Size': uncompressed_length,
                 })
             })
-            file_stream = pydyf.Stream([stream], file_extra)
+            file_stream = pydyf.Stream([b''.join(stream)], file_extra)
             pdf.add_object(file_stream)
 
     except URLFetchingError as exception:
@@ -326,18 +325,13 @@ def resolve_links(pages):
             if anchor_name not in anchors:
                 paged_anchors[-1].append((anchor_name, point_x, point_y))
                 anchors.add(anchor_name)
-    for page in pages:
+    for page, page_anchors in zip(pages, paged_anchors):
         page_links = []
         for link in page.links:
             link_type, anchor_name, _, _ = link
-            if link_type == 'internal':
-                if anchor_name not in anchors:
-                    LOGGER.error(
-                        'No anchor #%s for internal URI reference',
-                        anchor_name)
-                else:
-                    page_links.append(link)
+            if link_type == 'internal' and anchor_name not in anchors:
+                LOGGER.error(
+                    'No anchor #%s for internal URI reference', anchor_name)
             else:
-                # External link
                 page_links.append(link)
-        yield page_links, paged_anchors.pop(0)
+        yield page_links, page_anchors
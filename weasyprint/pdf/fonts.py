@@ -83,10 +83,9 @@ def build_fonts_dictionary(pdf, fonts, optimize_size):
             b'endcodespacerange',
             f'{len(cmap)} beginbfchar'.encode()])
         for glyph, text in cmap.items():
-            unicode_codepoints = ''.join(
-                f'{letter.encode("utf-16-be").hex()}' for letter in text)
+            unicode_codepoints = text.encode('utf-16-be').hex().encode()
             to_unicode.stream.append(
-                f'<{glyph:04x}> <{unicode_codepoints}>'.encode())
+                b'<%04x> <%s>' % (glyph, unicode_codepoints))
         to_unicode.stream.extend([
             b'endbfchar',
             b'endcmap',
@@ -161,10 +160,10 @@ def _build_bitmap_font_dictionary(font_dictionary, pdf, font, widths,
     font_dictionary['FontBBox'] = pydyf.Array([0, 0, 1, 1])
     font_dictionary['FontMatrix'] = pydyf.Array([1, 0, 0, 1, 0, 0])
     if 'fonts' in optimize_size:
-        chars = tuple(sorted(font.cmap))
+        chars = frozenset(font.cmap)
     else:
-        chars = tuple(range(256))
-    first, last = chars[0], chars[-1]
+        chars = frozenset(range(256))
+    first, last = min(chars), max(chars)
     font_dictionary['FirstChar'] = first
     font_dictionary['LastChar'] = last
     differences = []
@@ -368,26 +368,23 @@ class Stream(pydyf.Stream):
 
         # Read the PNG header, then discard it because we know it's a PNG. If
         # this weren't just output from Pillow, we should actually check it.
-        image_file.seek(8)
+        data = image_file.getvalue()
+        position = 8
 
-        png_data = b''
-        raw_chunk_length = image_file.read(4)
+        png_data = []
         # PNG files consist of a series of chunks.
-        while len(raw_chunk_length) > 0:
+        while position < len(data):
             # Each chunk begins with its data length (four bytes, may be zero),
             # then its type (four ASCII characters), then the data, then four
             # bytes of a CRC.
-            chunk_len, = struct.unpack('!I', raw_chunk_length)
-            chunk_type = image_file.read(4)
+            chunk_len, chunk_type = struct.unpack_from('!I4s', data, position)
+            position += 8
             if chunk_type == b'IDAT':
-                png_data += image_file.read(chunk_len)
-            else:
-                image_file.seek(chunk_len, io.SEEK_CUR)
+                png_data.append(data[position:position + chunk_len])
             # We aren't checking the CRC, we assume this is a valid PNG.
-            image_file.seek(4, io.SEEK_CUR)
-            raw_chunk_length = image_file.read(4)
+            position += chunk_len + 4
 
-        return png_data
+        return b''.join(png_data)
 
     def add_image(self, pillow_image, image_rendering, optimize_size):
         image_name = f'i{pillow_image.id}'
@@ -81,6 +81,11 @@ DEF_TYPES = frozenset((
     'pattern',
 ))
 
+PAINT_URL_RE = re.compile(r'(url\(.+\)) *(.*)')
+SPACES_RE = re.compile(' +')
+PRESERVED_WHITESPACE = str.maketrans('\n\r\t', '   ')
+COLLAPSED_WHITESPACE = str.maketrans('\t', ' ', '\n\r')
+
 
 class Node:
     """An SVG document node."""
@@ -195,11 +200,12 @@ class Node:
         if not string:
             return ''
         if preserve:
-            return re.sub('[\n\r\t]', ' ', string)
+            return string.translate(PRESERVED_WHITESPACE)
         else:
-            string = re.sub('[\n\r]', '', string)
-            string = re.sub('\t', ' ', string)
-            return re.sub(' +', ' ', string)
+            string = string.translate(COLLAPSED_WHITESPACE)
+            if '  ' in string:
+                string = SPACES_RE.sub(' ', string)
+            return string
 
     def get_child(self, id_):
         """Get a child with given id in the whole child tree."""
@@ -595,7 +601,7 @@ class SVG:
             return None, None
 
         value = value.strip()
-        match = re.compile(r'(url\(.+\)) *(.*)').search(value)
+        match = PAINT_URL_RE.search(value)
         if match:
             source = parse_url(match.group(1)).fragment
             color = match.group(2) or None
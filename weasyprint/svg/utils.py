@@ -9,6 +9,12 @@ from tinycss2.color3 import parse_color
 
 from ..matrix import Matrix
 
+NEGATIVE_NUMBER_RE = re.compile('(?<!e)-')
+SEPARATORS_RE = re.compile('[ \n\r\t,]+')
+CHAINED_DECIMALS_RE = re.compile(r'(\.[0-9-]+)(?=\.)')
+POINT_RE = re.compile('(.*?) (.*?)(?: |$)')
+TRANSFORMATION_RE = re.compile(r'(\w+) ?\( ?(.*?) ?\)')
+
 
 class PointError(Exception):
     """Exception raised when parsing a point fails."""
@@ -17,9 +23,9 @@ class PointError(Exception):
 def normalize(string):
     """Give a canonical version of a given value string."""
     string = (string or '').replace('E', 'e')
-    string = re.sub('(?<!e)-', ' -', string)
-    string = re.sub('[ \n\r\t,]+', ' ', string)
-    string = re.sub(r'(\.[0-9-]+)(?=\.)', r'\1 ', string)
+    string = NEGATIVE_NUMBER_RE.sub(' -', string)
+    string = SEPARATORS_RE.sub(' ', string)
+    string = CHAINED_DECIMALS_RE.sub(r'\1 ', string)
     return string.strip()
 
 
@@ -59,7 +65,7 @@ def size(string, font_size=None, percentage_reference=None):
 
 def point(svg, string, font_size):
     """Pop first two size values from a string."""
-    match = re.match('(.*?) (.*?)(?: |$)', string)
+    match = POINT_RE.match(string)
     if match:
         x, y = match.group(1, 2)
         string = string[match.end():]
@@ -141,8 +147,7 @@ def color(string):
 def transform(transform_string, font_size, normalized_diagonal):
     """Get a matrix corresponding to the transform string."""
     # TODO: merge with gather_anchors and css.validation.properties.transform
-    transformations = re.findall(
-        r'(\w+) ?\( ?(.*?) ?\)', normalize(transform_string))
+    transformations = TRANSFORMATION_RE.findall(normalize(transform_string))
     matrix = Matrix()
 
     for transformation_type, transformation in transformations:
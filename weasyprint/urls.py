@@ -7,6 +7,7 @@ import re
 import sys
 import traceback
 import zlib
+from functools import lru_cache
 from gzip import GzipFile
 from pathlib import Path
 from urllib.parse import quote, unquote, urljoin, urlsplit
@@ -54,6 +55,11 @@ def iri_to_uri(url):
     if url.startswith('data:'):
         # Data URIs can be huge, but don’t need this anyway.
         return url
+    return _iri_to_uri(url)
+
+
+@lru_cache()
+def _iri_to_uri(url):
     # Use UTF-8 as per RFC 3987 (IRI), except for file://
     url = url.encode(
         FILESYSTEM_ENCODING if url.startswith('file:') else 'utf-8')